@@ -10,30 +10,38 @@ import argparse
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from dateutil import parser as date_parser
 import re
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import contextlib
+import dbm
+import hashlib
+import importlib.util
+import io
+import bisect
+import itertools
 import json
+import mmap
 import os
+import shelve
+import threading
+import time
 
-# For AI service integrations
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
 
-try:
-    import ollama
-    OLLAMA_AVAILABLE = True
-except ImportError:
-    OLLAMA_AVAILABLE = False
+def _module_available(module_name: str) -> bool:
+    """Check whether a module is installed without importing it."""
+    return importlib.util.find_spec(module_name) is not None
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+
+# For AI service integrations - these are slow to import, so only check that
+# they are installed here and import them where they are first used
+OPENAI_AVAILABLE = _module_available('openai')
+OLLAMA_AVAILABLE = _module_available('ollama')
+REQUESTS_AVAILABLE = _module_available('requests')
+
+# Optional exact token counting for OpenAI prompts (also slow to import)
+TIKTOKEN_AVAILABLE = _module_available('tiktoken')
 
 # For book processing (PDF and EPUB)
 try:
@@ -50,6 +58,270 @@ try:
 except ImportError:
     EBOOKLIB_AVAILABLE = False
 
+# Optional C-accelerated ISO-8601 parsing
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+# Optional fast JSON encoding/decoding for custom API requests
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast non-cryptographic hashing for duplicate file detection
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Date layouts recognised in filenames, combined into one alternation so a
+# single scan finds the token; the matching group name selects the format
+DATE_PATTERN = re.compile(
+    r'(?P<ymd_dash>\d{4}-\d{2}-\d{2})'     # YYYY-MM-DD
+    r'|(?P<dmy_dash>\d{2}-\d{2}-\d{4})'    # DD-MM-YYYY
+    r'|(?P<dmy_slash>\d{2}/\d{2}/\d{4})'   # DD/MM/YYYY
+    r'|(?P<ymd_under>\d{4}_\d{2}_\d{2})'   # YYYY_MM_DD
+    r'|(?P<dmy_under>\d{2}_\d{2}_\d{4})'   # DD_MM_YYYY
+)
+DATE_FORMATS = {
+    'ymd_dash': '%Y-%m-%d',
+    'dmy_dash': '%d-%m-%Y',
+    'dmy_slash': '%d/%m/%Y',
+    'ymd_under': '%Y_%m_%d',
+    'dmy_under': '%d_%m_%Y',
+}
+
+# Cheap prefilter for the fuzzy fallback: dateutil can only find a date in a
+# name containing a digit or a month/weekday word
+DATE_HINT_PATTERN = re.compile(
+    r'\d|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|mon|tue|wed|thu|fri|sat|sun',
+    re.IGNORECASE)
+
+# Files with less content than this are not worth summarizing
+MIN_CONTENT_LENGTH = 20
+
+# File extensions handled for each content type
+TEXT_EXTENSIONS = ('.md', '.txt')
+BOOK_EXTENSIONS = ('.pdf', '.epub', '.mobi', '.azw', '.azw3')
+
+# On Windows os.scandir returns file metadata along with the listing, so
+# DirEntry.stat() is free there; on POSIX it is a separate stat() call
+SCANDIR_STAT_IS_FREE = os.name == 'nt'
+
+# Upper bound on threads used for blocking file I/O
+MAX_IO_WORKERS = 32
+
+# Only spread date extraction over threads when there are enough files to pay off
+PARALLEL_DATE_THRESHOLD = 256
+
+# OpenAI model used for summaries and for exact token counting
+OPENAI_MODEL = "gpt-4o-mini"
+
+# Context windows (in tokens) used to decide when a prompt must be chunked;
+# Ollama and custom endpoints often run with small windows, so assume 8k there
+OPENAI_CONTEXT_TOKENS = 128_000
+DEFAULT_CONTEXT_TOKENS = 8_192
+
+# Tokens held back for the response and for the prompt template
+RESPONSE_MAX_TOKENS = 500
+PROMPT_OVERHEAD_TOKENS = 512
+
+# Rough characters-per-token ratio used when tiktoken is not available
+CHARS_PER_TOKEN = 4
+
+# Upper bound on concurrent AI requests during the map phase
+MAX_AI_WORKERS = 8
+
+# First-round chunks also end at content-chosen points averaging this share of
+# the token budget, so adding or removing a file only moves nearby boundaries
+CHUNK_BOUNDARY_FRACTION = 0.5
+
+# Partial summaries are cached here so reruns skip the AI call
+SUMMARY_CACHE_PATH = Path.home() / '.cache' / 'log_summary' / 'summaries'
+
+# How long an Ollama availability probe result is reused, in seconds
+OLLAMA_PROBE_TTL_SECONDS = 60
+
+# Matches <think>...</think> blocks emitted by reasoning models
+THINK_TAG_PATTERN = re.compile(r'<think>.*?</think>', re.DOTALL | re.IGNORECASE)
+
+
+def _scandir_recursive(path, extensions: Tuple[str, ...]) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield directory entries for files ending in one of the extensions.
+    
+    Walks the tree once with os.scandir, whose entries cache their file type,
+    instead of globbing once per extension. Extensions are matched without
+    regard to case, like the single-file check. Unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _scandir_recursive(entry.path, extensions)
+                    elif entry.name.lower().endswith(extensions) and entry.is_file():
+                        yield entry
+                except PermissionError:
+                    continue
+    except PermissionError:
+        return
+
+
+def _thread_map(func: Callable, items: list, max_workers: int = MAX_IO_WORKERS) -> Iterator:
+    """
+    Lazily apply func to items on a thread pool, yielding results in input order.
+    
+    Threads release the GIL on blocking reads and stat calls, so I/O-bound
+    work scales with disk concurrency. Single items skip the pool entirely.
+    """
+    if len(items) < 2:
+        yield from map(func, items)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        yield from executor.map(func, items)
+
+
+def _iter_mapped_lines(filepath: Path, hasher=None) -> Iterator[bytes]:
+    """
+    Yield raw lines of a file from a read-only memory map, without decoding.
+    
+    Lines are split on LF, CRLF and CR, matching text-mode universal newlines.
+    If a hasher is given, it is fed the file as text mode would read it: each
+    line followed by LF only where the file had a line ending, so a missing
+    final newline still changes the digest.
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw_chunk in iter(mm.readline, b''):
+                for raw_line in raw_chunk.splitlines(keepends=True):
+                    line = raw_line.rstrip(b'\r\n')
+                    if hasher is not None:
+                        hasher.update(line)
+                        if len(line) != len(raw_line):
+                            hasher.update(b'\n')
+                    yield line
+
+
+def _stripped_length(raw_line: bytes) -> int:
+    """
+    Return the length of a raw UTF-8 line after str.strip(), decoding only if needed.
+    
+    Plain ASCII lines that do not start or end in whitespace/control characters
+    have the same length as bytes and as text, which covers nearly every line.
+    ASCII is always valid UTF-8; any other line is decoded strictly, so invalid
+    UTF-8 raises UnicodeDecodeError just as reading the file as text would.
+    """
+    stripped = raw_line.strip()
+    if not stripped:
+        return 0
+    if stripped.isascii() and stripped[0] > 0x20 and stripped[-1] > 0x20:
+        return len(stripped)
+    return len(stripped.decode('utf-8').strip())
+
+
+@lru_cache(maxsize=None)
+def _get_token_encoding(model: str):
+    """Load the tiktoken encoding for a model once; building it is the slow part."""
+    import tiktoken
+    return tiktoken.encoding_for_model(model)
+
+
+def _split_text_by_chars(text: str, max_chars: int) -> List[str]:
+    """Split text into pieces of at most max_chars, breaking at newlines where possible."""
+    pieces = []
+    start = 0
+    while len(text) - start > max_chars:
+        end = text.rfind('\n', start + 1, start + max_chars)
+        if end == -1:
+            end = start + max_chars
+        pieces.append(text[start:end])
+        start = end
+    pieces.append(text[start:])
+    return pieces
+
+
+def _new_content_hasher():
+    """Return an incremental hasher for detecting duplicate file contents."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+@lru_cache(maxsize=1)
+def _probe_ollama(time_bucket: int) -> bool:
+    """Check whether the Ollama service is running; cached per time bucket."""
+    try:
+        import ollama
+        ollama.list()
+        return True
+    except Exception:
+        return False
+
+
+def _ollama_service_available() -> bool:
+    """
+    Return whether the Ollama service is reachable, probing at most once per TTL.
+    
+    Both positive and negative results are reused for OLLAMA_PROBE_TTL_SECONDS so
+    repeated processor construction does not pay a round-trip each time.
+    """
+    if not OLLAMA_AVAILABLE:
+        return False
+    return _probe_ollama(int(time.monotonic() // OLLAMA_PROBE_TTL_SECONDS))
+
+
+def _create_http_session() -> 'requests.Session':
+    """Create a pooled keep-alive session that retries transient failures."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # A summary POST is not idempotent: after a read timeout or a 5xx the server
+    # may already have run (and billed) the generation. Only retry when the
+    # request never got through: connection failures, or a 429/503 rejection
+    retry = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _is_chunk_boundary(text: str, piece_tokens: int, boundary_tokens: int) -> bool:
+    """
+    Decide from a piece's content alone whether a chunk should end after it.
+    
+    Each piece is picked with probability piece_tokens / boundary_tokens, so
+    boundaries fall about boundary_tokens apart, and a given piece always makes
+    the same choice wherever it appears in the input.
+    """
+    digest = hashlib.sha256(text.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64 < piece_tokens / boundary_tokens
+
+
+class AISummarizer(NamedTuple):
+    """An AI backend chosen for summarization, with what is needed to size prompts."""
+    summarize: Callable[[str, int], str]
+    cache_namespace: str
+    context_tokens: int
+    token_model: Optional[str] = None
+
 
 class LogSummaryProcessor:
     """Main class for processing log files and generating summaries."""
@@ -69,47 +341,47 @@ class LogSummaryProcessor:
         self.content_type = content_type
         self.openai_client = None
         self.ollama_available = False
+        self._mtimes: Dict[Path, float] = {}
+        self._date_index = None
+        self._session = None  # pooled HTTP session, created on first custom API call
+        self._session_lock = threading.Lock()
         
         # Initialize AI clients based on provider preference
         if ai_provider in ['openai', 'auto']:
             if OPENAI_AVAILABLE and os.getenv('OPENAI_API_KEY'):
+                from openai import OpenAI
                 self.openai_client = OpenAI()
         
         if ai_provider in ['ollama', 'auto']:
-            if OLLAMA_AVAILABLE:
-                try:
-                    # Test if Ollama service is running
-                    ollama.list()
-                    self.ollama_available = True
-                except Exception:
-                    self.ollama_available = False
+            # Test if Ollama service is running (result is cached briefly)
+            self.ollama_available = _ollama_service_available()
     
     def find_files(self) -> List[Path]:
         """Find files based on content type (text or book files)."""
-        files = []
+        # A rescan may pick up changed files or mtimes, so drop cached dates
+        self._date_index = None
         
         # If path is a file, return it directly if it matches the content type
         if self.path.is_file():
             file_ext = self.path.suffix.lower()
-            if self.content_type == 'text' and file_ext in ['.md', '.txt']:
+            if self.content_type == 'text' and file_ext in TEXT_EXTENSIONS:
                 return [self.path]
-            elif self.content_type == 'book' and file_ext in ['.pdf', '.epub', '.mobi', '.azw', '.azw3']:
+            elif self.content_type == 'book' and file_ext in BOOK_EXTENSIONS:
                 return [self.path]
             else:
                 # Return the file anyway - let read_file_content handle unsupported formats
                 return [self.path]
         
-        # If path is a directory, search recursively
+        # If path is a directory, search recursively in a single pass
+        files = []
+        self._mtimes = {}
         if self.path.is_dir():
-            if self.content_type == 'text':
-                # Search for .md and .txt files recursively
-                for pattern in ['**/*.md', '**/*.txt']:
-                    files.extend(self.path.glob(pattern))
-            elif self.content_type == 'book':
-                # Search for book files recursively  
-                book_patterns = ['**/*.pdf', '**/*.epub', '**/*.mobi', '**/*.azw', '**/*.azw3']
-                for pattern in book_patterns:
-                    files.extend(self.path.glob(pattern))
+            extensions = TEXT_EXTENSIONS if self.content_type == 'text' else BOOK_EXTENSIONS
+            for entry in _scandir_recursive(self.path, extensions):
+                file_path = Path(entry.path)
+                if SCANDIR_STAT_IS_FREE:
+                    self._mtimes[file_path] = entry.stat().st_mtime
+                files.append(file_path)
         
         return sorted(files)
     
@@ -117,52 +389,65 @@ class LogSummaryProcessor:
         """Legacy method for backward compatibility - finds .md and .txt files."""
         return self.find_files() if self.content_type == 'text' else []
     
-    def extract_date_from_filename(self, filepath: Path) -> Optional[datetime]:
+    def extract_date_from_filename(self, filepath: Path,
+                                   cached_mtime: Optional[float] = None) -> Optional[datetime]:
         """
         Extract date from filename using various date formats.
         
         Supports formats like:
         - YYYY-MM-DD (ISO format)
         - DD-MM-YYYY
-        - DD/MM/YYYY (converted to DD-MM-YYYY for parsing)
+        - DD/MM/YYYY
         - YYYY_MM_DD
         - And other common formats that dateutil can parse
+        
+        If no date is found, the file's modification time is used; pass
+        cached_mtime when it is already known to skip the stat() call.
         """
+        file_date = self.extract_date_from_name(filepath)
+        if file_date is not None:
+            return file_date
+        return self.extract_date_from_mtime(filepath, cached_mtime)
+    
+    def extract_date_from_name(self, filepath: Path) -> Optional[datetime]:
+        """Parse a date from the filename alone, or return None if it has none."""
         filename = filepath.stem  # Get filename without extension
         
-        # Common date patterns to look for
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',      # YYYY-MM-DD
-            r'\d{2}-\d{2}-\d{4}',      # DD-MM-YYYY
-            r'\d{2}/\d{2}/\d{4}',      # DD/MM/YYYY
-            r'\d{4}_\d{2}_\d{2}',      # YYYY_MM_DD
-            r'\d{2}_\d{2}_\d{4}',      # DD_MM_YYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, filename)
-            if match:
-                date_str = match.group()
-                # Convert / to - for consistent parsing
-                date_str = date_str.replace('/', '-').replace('_', '-')
-                
-                try:
-                    # Use dateutil parser for flexible date parsing
-                    parsed_date = date_parser.parse(date_str, dayfirst=True)
-                    return parsed_date
-                except (ValueError, TypeError):
-                    continue
+        # The regex pins the exact layout, so parse with the matching format
+        # directly and only fall back to dateutil's heuristics if none apply
+        for match in DATE_PATTERN.finditer(filename):
+            date_str = match.group()
+            
+            try:
+                if CISO8601_AVAILABLE and match.lastgroup == 'ymd_dash':
+                    return ciso8601.parse_datetime(date_str)
+                return datetime.strptime(date_str, DATE_FORMATS[match.lastgroup])
+            except ValueError:
+                continue
         
         # If no date found in filename, try parsing the entire filename
-        try:
-            parsed_date = date_parser.parse(filename, fuzzy=True)
-            return parsed_date
-        except (ValueError, TypeError):
-            pass
+        if DATE_HINT_PATTERN.search(filename):
+            from dateutil import parser as date_parser
+            try:
+                parsed_date = date_parser.parse(filename, fuzzy=True)
+                # Names like "meeting 10am UTC" parse as timezone-aware; convert
+                # to naive local time so they compare with every other date
+                if parsed_date.tzinfo is not None:
+                    parsed_date = parsed_date.astimezone().replace(tzinfo=None)
+                return parsed_date
+            except (ValueError, TypeError):
+                pass
         
-        # Fall back to file modification time if no date in filename
+        return None
+    
+    def extract_date_from_mtime(self, filepath: Path,
+                                cached_mtime: Optional[float] = None) -> Optional[datetime]:
+        """Date a file by its modification time, for names without a date."""
         try:
-            mtime = filepath.stat().st_mtime
+            if cached_mtime is not None:
+                mtime = cached_mtime
+            else:
+                mtime = os.path.getmtime(filepath)
             return datetime.fromtimestamp(mtime)
         except OSError:
             return None
@@ -180,41 +465,108 @@ class LogSummaryProcessor:
         Returns:
             List of tuples (filepath, parsed_date) within the timeframe
         """
-        files_with_dates = []
+        # Dates are extracted and sorted once per scan, so repeated calls with the
+        # same files (e.g. different timeframes) only bisect. The index keeps a
+        # snapshot of the paths and is rebuilt if the list has changed since
+        if not self._date_index_matches(files):
+            self._date_index = self._build_date_index(files)
+        _, dates, files_by_date = self._date_index
         
-        # Extract dates from all files
-        for file_path in files:
-            file_date = self.extract_date_from_filename(file_path)
-            if file_date:
-                files_with_dates.append((file_path, file_date))
+        start_date, end_date = self.parse_timeframe(timeframe)
+        lo = bisect.bisect_left(dates, start_date)
+        hi = bisect.bisect_left(dates, end_date)
         
+        # Restore the input order of the matching files
+        return [(fp, fd) for _, fp, fd in sorted(files_by_date[lo:hi])]
+    
+    def _date_index_matches(self, files: List[Path]) -> bool:
+        """Check whether the date index was built from exactly these file objects."""
+        if self._date_index is None:
+            return False
+        indexed_files = self._date_index[0]
+        # Identity checks are cheap and still catch in-place edits to the list
+        return (len(indexed_files) == len(files)
+                and all(indexed is current for indexed, current in zip(indexed_files, files)))
+    
+    def _build_date_index(self, files: List[Path]
+                          ) -> Tuple[Tuple[Path, ...], List[datetime], List[Tuple[int, Path, datetime]]]:
+        """
+        Extract dates for files and sort them chronologically.
+        
+        Returns:
+            Tuple of (snapshot of files, sorted dates, (input index, filepath, date) tuples in
+            the same order as the dates)
+        """
+        # Parse names serially: regex/strptime work is CPU-bound and holds the GIL
+        file_dates = [self.extract_date_from_name(file_path) for file_path in files]
+        
+        # Only files without a date in their name need a stat(); those calls block
+        # on I/O, so large batches of them are overlapped on the thread pool
+        undated = [index for index, file_date in enumerate(file_dates) if file_date is None]
+        
+        def extract_mtime_date(file_path: Path) -> Optional[datetime]:
+            return self.extract_date_from_mtime(file_path, self._mtimes.get(file_path))
+        
+        undated_files = [files[index] for index in undated]
+        if len(undated_files) >= PARALLEL_DATE_THRESHOLD:
+            mtime_dates = _thread_map(extract_mtime_date, undated_files)
+        else:
+            mtime_dates = map(extract_mtime_date, undated_files)
+        for index, file_date in zip(undated, mtime_dates):
+            file_dates[index] = file_date
+        
+        files_by_date = sorted(
+            ((index, file_path, file_date)
+             for index, (file_path, file_date) in enumerate(zip(files, file_dates))
+             if file_date),
+            key=lambda item: item[2]
+        )
+        dates = [file_date for _, _, file_date in files_by_date]
+        return tuple(files), dates, files_by_date
+    
+    def parse_timeframe(self, timeframe: str = None) -> Tuple[datetime, datetime]:
+        """
+        Convert a timeframe string into a half-open [start, end) date range.
+        
+        Args:
+            timeframe: "2025" for a year, "2025-05" for a month, a full date for a
+                      single day, or None for last week (default)
+        
+        Returns:
+            Tuple of (start, end) datetimes; files dated start <= date < end match
+        """
         if not timeframe:
             # Default: last week
-            cutoff_date = datetime.now() - timedelta(days=7)
-            return [(fp, fd) for fp, fd in files_with_dates if fd >= cutoff_date]
+            return datetime.now() - timedelta(days=7), datetime.max
         
-        # Parse timeframe parameter
         try:
             if len(timeframe) == 4:  # Year only (e.g., "2025")
                 year = int(timeframe)
-                return [(fp, fd) for fp, fd in files_with_dates if fd.year == year]
+                return datetime(year, 1, 1), datetime(year + 1, 1, 1)
             
             elif len(timeframe) == 7 and '-' in timeframe:  # Year-Month (e.g., "2025-05")
                 year, month = map(int, timeframe.split('-'))
-                return [(fp, fd) for fp, fd in files_with_dates 
-                       if fd.year == year and fd.month == month]
+                start_date = datetime(year, month, 1)
+                if month == 12:
+                    return start_date, datetime(year + 1, 1, 1)
+                return start_date, datetime(year, month + 1, 1)
             
             else:
-                # Try to parse as a full date
-                target_date = date_parser.parse(timeframe)
-                # Return files from that specific day
-                return [(fp, fd) for fp, fd in files_with_dates 
-                       if fd.date() == target_date.date()]
+                # Try the known filename layouts before dateutil's flexible parser
+                match = DATE_PATTERN.fullmatch(timeframe)
+                if match:
+                    target_date = datetime.strptime(timeframe, DATE_FORMATS[match.lastgroup])
+                else:
+                    from dateutil import parser as date_parser
+                    target_date = date_parser.parse(timeframe)
+                
+                # Match files from that specific day
+                start_date = datetime.combine(target_date.date(), datetime.min.time())
+                return start_date, start_date + timedelta(days=1)
                 
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             print(f"Warning: Could not parse timeframe '{timeframe}'. Using last week.")
-            cutoff_date = datetime.now() - timedelta(days=7)
-            return [(fp, fd) for fp, fd in files_with_dates if fd >= cutoff_date]
+            return datetime.now() - timedelta(days=7), datetime.max
     
     def read_pdf_content(self, filepath: Path) -> str:
         """
@@ -240,7 +592,7 @@ class LogSummaryProcessor:
             for page_num in range(doc.page_count):
                 page = doc[page_num]
                 text = page.get_text()
-                if text.strip():  # Only add non-empty pages
+                if text and not text.isspace():  # Only add non-empty pages
                     # Add page delimiter for potential future page-specific processing
                     full_text.append(f"=== Page {page_num + 1} ===\n{text}")
             
@@ -278,7 +630,7 @@ class LogSummaryProcessor:
                     soup = BeautifulSoup(item.get_content(), 'html.parser')
                     text = soup.get_text()
                     
-                    if text.strip():  # Only add non-empty chapters
+                    if text and not text.isspace():  # Only add non-empty chapters
                         # Add chapter delimiter for potential future chapter-specific processing
                         chapter_title = getattr(item, 'title', f'Chapter {chapter_num}') or f'Chapter {chapter_num}'
                         full_text.append(f"=== {chapter_title} ===\n{text}")
@@ -305,7 +657,10 @@ class LogSummaryProcessor:
                 return self.read_pdf_content(filepath)
             elif file_ext == '.epub':
                 return self.read_epub_content(filepath)
-            elif file_ext in ['.txt', '.md']:
+            elif file_ext in TEXT_EXTENSIONS:
+                # Skip opening zero-byte files
+                if filepath.stat().st_size == 0:
+                    return ""
                 with open(filepath, 'r', encoding='utf-8') as f:
                     return f.read()
             elif file_ext in ['.mobi', '.azw', '.azw3']:
@@ -330,8 +685,7 @@ class LogSummaryProcessor:
             return text.strip()
         
         # Remove everything between <think> and </think> tags, including the tags themselves
-        cleaned = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        return cleaned.strip()
+        return THINK_TAG_PATTERN.sub('', text).strip()
     
     def generate_summary_with_openai(self, content: str, bullet_count: int, 
                                     preserve_thinking: bool = False) -> str:
@@ -352,12 +706,12 @@ etc."""
         
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",  # Using the more cost-effective model
+                model=OPENAI_MODEL,  # Using the more cost-effective model
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant that creates concise summaries."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=500,
+                max_tokens=RESPONSE_MAX_TOKENS,
                 temperature=0.3
             )
             
@@ -384,6 +738,7 @@ Provide exactly {bullet_count} bullet points, formatted as:
 etc."""
         
         try:
+            import ollama
             response = ollama.chat(
                 model=model,
                 messages=[
@@ -403,12 +758,21 @@ etc."""
         except Exception as e:
             raise ValueError(f"Ollama API error: {e}")
     
+    def _get_http_session(self) -> 'requests.Session':
+        """Return the shared HTTP session, creating it once even when called from many threads."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = _create_http_session()
+        return self._session
+    
     def generate_summary_with_custom_api(self, content: str, bullet_count: int,
                                        api_url: str, api_key: str = None, 
                                        preserve_thinking: bool = False) -> str:
         """Generate summary using a custom API endpoint."""
         if not REQUESTS_AVAILABLE:
             raise ValueError("Requests library not available. Install with: pip install requests")
+        session = self._get_http_session()
         
         prompt = f"""Please summarize the following text content into exactly {bullet_count} bullet points.
 Focus on the most important information, tasks, and key insights.
@@ -431,16 +795,20 @@ etc."""
                 {"role": "system", "content": "You are a helpful assistant that creates concise summaries."},
                 {"role": "user", "content": prompt}
             ],
-            "max_tokens": 500,
+            "max_tokens": RESPONSE_MAX_TOKENS,
             "temperature": 0.3
         }
         
         try:
-            response = requests.post(api_url, json=payload, headers=headers, timeout=30)
+            if ORJSON_AVAILABLE:
+                response = session.post(api_url, data=orjson.dumps(payload),
+                                              headers=headers, timeout=30)
+            else:
+                response = session.post(api_url, json=payload, headers=headers, timeout=30)
             response.raise_for_status()
             
             # Try to extract content from common response formats
-            response_json = response.json()
+            response_json = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             # OpenAI-compatible format
             if 'choices' in response_json:
@@ -457,30 +825,135 @@ etc."""
         except Exception as e:
             raise ValueError(f"Custom API error: {e}")
     
+    def _iter_meaningful_lines(self, content: str) -> Iterator[str]:
+        """Lazily yield stripped lines, skipping empty and very short ones."""
+        for line in io.StringIO(content):
+            if len(stripped := line.strip()) > 10:
+                yield stripped
+    
     def generate_summary_basic(self, content: str, bullet_count: int) -> str:
         """
         Generate a basic summary without AI - just extract key lines.
         This is a fallback when no AI service is available.
         """
-        lines = content.split('\n')
-        # Filter out empty lines and very short lines
-        meaningful_lines = [line.strip() for line in lines 
-                          if line.strip() and len(line.strip()) > 10]
+        # Count meaningful lines in a first streaming pass, without building a list
+        line_count = sum(1 for _ in self._iter_meaningful_lines(content))
         
-        if not meaningful_lines:
+        if not line_count:
             return "• No meaningful content found."
         
+        # Take evenly distributed lines up to bullet_count in a second pass
+        if line_count <= bullet_count:
+            selected_lines = list(self._iter_meaningful_lines(content))
+        else:
+            step = line_count / bullet_count
+            wanted = [int(i * step) for i in range(bullet_count)]
+            wanted_set = set(wanted)
+            selected_lines = [line for index, line in enumerate(
+                                  itertools.islice(self._iter_meaningful_lines(content), wanted[-1] + 1))
+                              if index in wanted_set]
+        
+        return self._format_bullets(selected_lines)
+    
+    def generate_summary_basic_from_files(self, files: List[Tuple[Path, datetime]],
+                                          bullet_count: int) -> Tuple[str, List[str], int]:
+        """
+        Generate a basic summary by streaming text files straight from disk.
+        
+        Produces the same bullets as generate_summary_basic on the combined content,
+        but memory-maps each file instead of reading it into a string. A first pass
+        counts meaningful lines per file; the second only revisits files holding a
+        selected line and decodes just those lines. Files that are not valid UTF-8
+        are skipped with a warning, as read_file_content does, and files whose
+        lines repeat an earlier file's are skipped.
+        
+        Args:
+            files: List of (filepath, file_date) tuples for .txt/.md files
+            bullet_count: Number of bullet points to generate
+        
+        Returns:
+            Tuple of (summary, names of files that had content, duplicates skipped)
+        """
+        # First pass: count meaningful lines in each file; the section header
+        # written for each file is itself one meaningful line
+        sections = []
+        seen_digests = set()
+        duplicate_count = 0
+        for filepath, file_date in files:
+            try:
+                file_size = filepath.stat().st_size
+                if file_size < MIN_CONTENT_LENGTH:
+                    continue
+                # Multi-byte characters or CRLF endings can leave a small file
+                # under MIN_CONTENT_LENGTH characters; decode those to check
+                if (file_size < MIN_CONTENT_LENGTH * 4
+                        and len(self.read_file_content(filepath)) < MIN_CONTENT_LENGTH):
+                    continue
+                
+                line_count = 0
+                has_text = False
+                hasher = _new_content_hasher()
+                for raw_line in _iter_mapped_lines(filepath, hasher):
+                    length = _stripped_length(raw_line)
+                    if length:
+                        has_text = True
+                        if length > 10:
+                            line_count += 1
+            except (OSError, ValueError) as e:  # includes UnicodeDecodeError
+                print(f"Warning: Could not read {filepath}: {e}")
+                continue
+            
+            if has_text:
+                # Copies of the same file (e.g. in backup trees) would only repeat lines
+                digest = hasher.digest()
+                if digest in seen_digests:
+                    duplicate_count += 1
+                    continue
+                seen_digests.add(digest)
+                
+                header = f"=== {filepath.name} ({file_date.strftime('%Y-%m-%d')}) ==="
+                sections.append((filepath, header, line_count + 1))
+        
+        processed_files = [filepath.name for filepath, _, _ in sections]
+        total_lines = sum(count for _, _, count in sections)
+        
+        if not total_lines:
+            return "• No meaningful content found.", processed_files, duplicate_count
+        
         # Take evenly distributed lines up to bullet_count
-        if len(meaningful_lines) <= bullet_count:
-            selected_lines = meaningful_lines
+        if total_lines <= bullet_count:
+            wanted = list(range(total_lines))
         else:
-            step = len(meaningful_lines) / bullet_count
-            selected_lines = [meaningful_lines[int(i * step)] 
-                            for i in range(bullet_count)]
+            step = total_lines / bullet_count
+            wanted = [int(i * step) for i in range(bullet_count)]
         
-        # Format as bullet points
+        # Second pass: skip files without a selected line, decode only the survivors
+        selected_lines = []
+        section_start = 0
+        for filepath, header, line_count in sections:
+            section_end = section_start + line_count
+            lo = bisect.bisect_left(wanted, section_start)
+            hi = bisect.bisect_left(wanted, section_end)
+            if lo < hi:
+                file_wanted = set(wanted[lo:hi])
+                if section_start in file_wanted:
+                    selected_lines.append(header)
+                index = section_start + 1
+                for raw_line in _iter_mapped_lines(filepath):
+                    if index >= section_end:
+                        break
+                    if _stripped_length(raw_line) > 10:
+                        if index in file_wanted:
+                            selected_lines.append(raw_line.decode('utf-8').strip())
+                        index += 1
+            section_start = section_end
+        
+        return self._format_bullets(selected_lines), processed_files, duplicate_count
+    
+    def _format_bullets(self, selected_lines: List[str]) -> str:
+        """Format selected lines as bullet points, truncating very long ones."""
         bullets = []
-        for i, line in enumerate(selected_lines):
+        for line in selected_lines:
             # Truncate very long lines
             if len(line) > 100:
                 line = line[:97] + "..."
@@ -488,10 +961,227 @@ etc."""
         
         return '\n'.join(bullets)
     
+    def select_ai_summarizer(self, ollama_model: str = 'llama3.2', custom_api_url: str = None,
+                             custom_api_key: str = None, preserve_thinking: bool = False
+                             ) -> Optional[AISummarizer]:
+        """
+        Pick the AI backend to use based on the provider preference.
+        
+        Returns:
+            AISummarizer wrapping summarize(content, bullet_count), or None if no
+            AI service is available
+        """
+        if custom_api_url:
+            summarizer = AISummarizer(
+                partial(self.generate_summary_with_custom_api, api_url=custom_api_url,
+                        api_key=custom_api_key, preserve_thinking=preserve_thinking),
+                f"custom:{custom_api_url}", DEFAULT_CONTEXT_TOKENS)
+        elif self.ai_provider == 'ollama' and self.ollama_available:
+            summarizer = self._ollama_summarizer(ollama_model, preserve_thinking)
+        elif self.ai_provider == 'openai' and self.openai_client:
+            summarizer = self._openai_summarizer(preserve_thinking)
+        elif self.ai_provider == 'auto':
+            # Try methods in order of preference: OpenAI -> Ollama -> Basic
+            if self.openai_client:
+                summarizer = self._openai_summarizer(preserve_thinking)
+            elif self.ollama_available:
+                summarizer = self._ollama_summarizer(ollama_model, preserve_thinking)
+            else:
+                print("Warning: No AI services available. Using basic summarization.")
+                return None
+        else:
+            print("Warning: Requested AI service not available. Using basic summarization.")
+            return None
+        
+        if preserve_thinking:
+            summarizer = summarizer._replace(cache_namespace=summarizer.cache_namespace + ":think")
+        return summarizer
+    
+    def _openai_summarizer(self, preserve_thinking: bool) -> AISummarizer:
+        """Wrap generate_summary_with_openai as an AISummarizer."""
+        return AISummarizer(
+            partial(self.generate_summary_with_openai, preserve_thinking=preserve_thinking),
+            f"openai:{OPENAI_MODEL}", OPENAI_CONTEXT_TOKENS, OPENAI_MODEL)
+    
+    def _ollama_summarizer(self, ollama_model: str, preserve_thinking: bool) -> AISummarizer:
+        """Wrap generate_summary_with_ollama as an AISummarizer."""
+        return AISummarizer(
+            partial(self.generate_summary_with_ollama, model=ollama_model,
+                    preserve_thinking=preserve_thinking),
+            f"ollama:{ollama_model}", DEFAULT_CONTEXT_TOKENS)
+    
+    def load_token_encoding(self, token_model: Optional[str]):
+        """Return the tiktoken encoding for token_model, or None to estimate tokens."""
+        if not token_model or not TIKTOKEN_AVAILABLE:
+            return None
+        try:
+            return _get_token_encoding(token_model)
+        except Exception as e:
+            print(f"Warning: Could not load tiktoken encoding ({e}). Estimating tokens.")
+            return None
+    
+    def count_tokens(self, text: str, encoding=None) -> int:
+        """Count tokens exactly with a tiktoken encoding, or estimate from length."""
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        return len(text) // CHARS_PER_TOKEN
+    
+    def chunk_sections(self, sections: List[Tuple[str, str]], max_tokens: int,
+                       encoding=None) -> Optional[List[str]]:
+        """
+        Decide whether sections fit in one prompt, and pack them into chunks if not.
+        
+        Sections that are too large on their own are first split into parts; the
+        pieces are then packed in order into chunks that fit the budget. Besides
+        the budget, a chunk also ends after any piece whose content hash picks it
+        as a boundary, so chunks (and their cache keys) stay the same when files
+        elsewhere in the timeframe are added or dropped. Each section is encoded
+        once and the same tokens are reused for splitting.
+        
+        Args:
+            sections: List of (section header, content) tuples
+            max_tokens: Token budget for the content of a single prompt
+            encoding: tiktoken encoding for exact counts, or None to estimate
+        
+        Returns:
+            None if everything fits in one prompt, otherwise a list of prompt texts
+            that each fit the budget
+        """
+        pieces = []
+        for header, content in sections:
+            # Headers and the blank line between sections cost a few tokens each
+            header_tokens = self.count_tokens(header, encoding) + 2
+            if encoding is not None:
+                tokens = encoding.encode(content, disallowed_special=())
+                content_tokens = len(tokens)
+            else:
+                content_tokens = len(content) // CHARS_PER_TOKEN
+            
+            if header_tokens + content_tokens <= max_tokens:
+                pieces.append((f"{header}\n{content}", header_tokens + content_tokens))
+                continue
+            
+            # Leave room for the "(part i/n)" suffix on each part's header
+            part_budget = max(max_tokens - header_tokens - 8, 1)
+            if encoding is not None:
+                parts = [encoding.decode(tokens[start:start + part_budget])
+                         for start in range(0, content_tokens, part_budget)]
+            else:
+                parts = _split_text_by_chars(content, part_budget * CHARS_PER_TOKEN)
+            for number, part in enumerate(parts, 1):
+                pieces.append((f"{header} (part {number}/{len(parts)})\n{part}",
+                               header_tokens + 8 + self.count_tokens(part, encoding)))
+        
+        if sum(piece_tokens for _, piece_tokens in pieces) <= max_tokens:
+            return None
+        return self._pack_pieces(pieces, max_tokens,
+                                 boundary_tokens=int(max_tokens * CHUNK_BOUNDARY_FRACTION))
+    
+    def _pack_pieces(self, pieces: List[Tuple[str, int]], max_tokens: int,
+                     boundary_tokens: Optional[int] = None) -> List[str]:
+        """
+        Join (text, token count) pieces, in order, into chunks within max_tokens.
+        
+        Without boundary_tokens the packing is purely greedy. With it, a chunk
+        also ends after each piece selected by _is_chunk_boundary, which places
+        content-defined boundaries about boundary_tokens apart on average.
+        """
+        chunks = []
+        current = []
+        current_tokens = 0
+        for text, piece_tokens in pieces:
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append('\n\n'.join(current))
+                current = []
+                current_tokens = 0
+            current.append(text)
+            current_tokens += piece_tokens
+            if boundary_tokens and _is_chunk_boundary(text, piece_tokens, boundary_tokens):
+                chunks.append('\n\n'.join(current))
+                current = []
+                current_tokens = 0
+        if current:
+            chunks.append('\n\n'.join(current))
+        return chunks
+    
+    def generate_summary_map_reduce(self, chunks: List[str], bullet_count: int,
+                                    summarize: Callable[[str, int], str], cache_namespace: str,
+                                    max_tokens: int, encoding=None, use_cache: bool = True) -> str:
+        """
+        Summarize each chunk separately, then merge the partial summaries.
+        
+        Chunk calls run concurrently so their network round-trips overlap, and
+        unless use_cache is False their results are cached by content hash so
+        unchanged input is not sent to the AI service again on later runs. If
+        the merged partial summaries are still over the token budget, they are
+        packed and summarized again in further rounds until the final prompt fits.
+        
+        Args:
+            chunks: Prompt texts that each fit within max_tokens
+            bullet_count: Number of bullet points in the final summary
+            summarize: Callable taking (content, bullet_count) and returning bullets
+            cache_namespace: Identifies the provider/model in cache keys
+            max_tokens: Token budget for the content of a single prompt
+            encoding: tiktoken encoding for exact counts, or None to estimate
+            use_cache: Whether to read and write the on-disk summary cache
+        
+        Returns:
+            Merged summary with bullet_count bullet points
+        """
+        while True:
+            # Ask every chunk for the full bullet count: scaling it by the number
+            # of chunks would change every cache key whenever that number changes
+            partial_summaries = self._summarize_chunks(chunks, bullet_count, summarize,
+                                                       cache_namespace, use_cache)
+            
+            merged = '\n\n'.join(partial_summaries)
+            if self.count_tokens(merged, encoding) <= max_tokens:
+                return summarize(merged, bullet_count)
+            
+            # Too many partial summaries for one prompt: reduce them in another round
+            pieces = [(partial_summary, self.count_tokens(partial_summary, encoding) + 2)
+                      for partial_summary in partial_summaries]
+            next_chunks = self._pack_pieces(pieces, max_tokens)
+            if len(next_chunks) >= len(chunks):
+                raise ValueError("Partial summaries are too long to merge within the context window")
+            chunks = next_chunks
+    
+    def _summarize_chunks(self, chunks: List[str], chunk_bullets: int,
+                          summarize: Callable[[str, int], str], cache_namespace: str,
+                          use_cache: bool = True) -> List[str]:
+        """Summarize chunks concurrently, reusing and filling the on-disk cache if enabled."""
+        cache_keys = [
+            f"{cache_namespace}:{chunk_bullets}:{hashlib.sha256(chunk.encode('utf-8')).hexdigest()}"
+            for chunk in chunks
+        ]
+        
+        cache_context = self._open_summary_cache() if use_cache else contextlib.nullcontext({})
+        with cache_context as cache:
+            partial_summaries = [cache.get(key) for key in cache_keys]
+            missing = [i for i, partial_summary in enumerate(partial_summaries) if partial_summary is None]
+            
+            # Only uncached chunks go to the AI service, a bounded number at a time
+            results = _thread_map(lambda chunk: summarize(chunk, chunk_bullets),
+                                  [chunks[i] for i in missing], max_workers=MAX_AI_WORKERS)
+            for i, result in zip(missing, results):
+                partial_summaries[i] = result
+                cache[cache_keys[i]] = result
+        
+        return partial_summaries
+    
+    def _open_summary_cache(self):
+        """Open the on-disk summary cache, or an in-memory dict if it is unusable."""
+        try:
+            SUMMARY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            return shelve.open(str(SUMMARY_CACHE_PATH))
+        except dbm.error as e:  # a tuple that already includes OSError
+            print(f"Warning: Could not open summary cache ({e}). Continuing without it.")
+            return contextlib.nullcontext({})
+    
     def process_files(self, timeframe: str = None, bullet_count: int = 5, 
                      use_ai: bool = True, ollama_model: str = 'llama3.2',
                      custom_api_url: str = None, custom_api_key: str = None,
-                     preserve_thinking: bool = False) -> str:
+                     preserve_thinking: bool = False, use_cache: bool = True) -> str:
         """
         Main processing function that orchestrates the entire workflow.
         
@@ -503,6 +1193,7 @@ etc."""
             custom_api_url: Custom API endpoint URL
             custom_api_key: API key for custom endpoint
             preserve_thinking: Whether to preserve thinking output (default: False)
+            use_cache: Whether to cache partial summaries on disk (default: True)
         
         Returns:
             Generated summary as string
@@ -522,58 +1213,106 @@ etc."""
             timeframe_desc = timeframe or "the last week"
             return f"No files found for timeframe: {timeframe_desc}"
         
-        # Read and combine content from all filtered files
-        all_content = []
+        # Without AI, text files can be summarized straight from disk
+        if not use_ai and all(fp.suffix.lower() in TEXT_EXTENSIONS for fp, _ in filtered_files):
+            summary, processed_files, duplicate_count = self.generate_summary_basic_from_files(
+                filtered_files, bullet_count)
+            if not processed_files:
+                return "No content found in the selected files."
+            return self._build_header(timeframe, processed_files, bullet_count, duplicate_count) + summary
+        
+        # Collect (header, content) sections; the combined prompt text is only
+        # built on the paths that send everything at once
         processed_files = []
+        sections = []
+        seen_contents = set()
+        duplicate_count = 0
         
-        for filepath, file_date in filtered_files:
-            content = self.read_file_content(filepath)
-            if content.strip():  # Only include non-empty files
-                all_content.append(f"=== {filepath.name} ({file_date.strftime('%Y-%m-%d')}) ===\n{content}")
-                processed_files.append(filepath.name)
+        # Read plain text files concurrently. PDF and ebook readers such as
+        # PyMuPDF are not thread-safe, so those files are read one at a time
+        contents = [None] * len(filtered_files)
+        text_indices = [index for index, (filepath, _) in enumerate(filtered_files)
+                        if filepath.suffix.lower() in TEXT_EXTENSIONS]
+        text_contents = _thread_map(self.read_file_content,
+                                    [filtered_files[index][0] for index in text_indices])
+        for index, content in zip(text_indices, text_contents):
+            contents[index] = content
+        for index, (filepath, _) in enumerate(filtered_files):
+            if contents[index] is None:
+                contents[index] = self.read_file_content(filepath)
         
-        if not all_content:
-            return "No content found in the selected files."
+        for (filepath, file_date), content in zip(filtered_files, contents):
+            # Only include files with meaningful content; isspace() avoids the
+            # full copy of the file that strip() would make
+            if len(content) >= MIN_CONTENT_LENGTH and not content.isspace():
+                # Send each distinct file body once; the first path keeps its date.
+                # str hashing runs in C and is cached, so the set check is cheap
+                if content in seen_contents:
+                    duplicate_count += 1
+                    continue
+                seen_contents.add(content)
+                
+                name = filepath.name
+                section_header = f"=== {name} ({file_date.strftime('%Y-%m-%d')}) ==="
+                processed_files.append(name)
+                sections.append((section_header, content))
+        
+        # Release the duplicate bodies; sections holds the ones still needed
+        del contents, seen_contents
         
-        combined_content = '\n\n'.join(all_content)
+        if not processed_files:
+            return "No content found in the selected files."
         
         # Generate summary using the best available method
         try:
-            if not use_ai:
-                summary = self.generate_summary_basic(combined_content, bullet_count)
-            elif custom_api_url:
-                summary = self.generate_summary_with_custom_api(
-                    combined_content, bullet_count, custom_api_url, custom_api_key, preserve_thinking)
-            elif self.ai_provider == 'ollama' and self.ollama_available:
-                summary = self.generate_summary_with_ollama(combined_content, bullet_count, ollama_model, preserve_thinking)
-            elif self.ai_provider == 'openai' and self.openai_client:
-                summary = self.generate_summary_with_openai(combined_content, bullet_count, preserve_thinking)
-            elif self.ai_provider == 'auto':
-                # Try methods in order of preference: OpenAI -> Ollama -> Basic
-                if self.openai_client:
-                    summary = self.generate_summary_with_openai(combined_content, bullet_count, preserve_thinking)
-                elif self.ollama_available:
-                    summary = self.generate_summary_with_ollama(combined_content, bullet_count, ollama_model, preserve_thinking)
-                else:
-                    print("Warning: No AI services available. Using basic summarization.")
-                    summary = self.generate_summary_basic(combined_content, bullet_count)
+            ai_summarizer = None
+            if use_ai:
+                ai_summarizer = self.select_ai_summarizer(
+                    ollama_model, custom_api_url, custom_api_key, preserve_thinking)
+            
+            if not ai_summarizer:
+                summary = self.generate_summary_basic(self._join_sections(sections), bullet_count)
             else:
-                print("Warning: Requested AI service not available. Using basic summarization.")
-                summary = self.generate_summary_basic(combined_content, bullet_count)
+                # Split prompts that would overflow the model's context window up front,
+                # rather than letting the request fail or get truncated server-side
+                prompt_budget = ai_summarizer.context_tokens - RESPONSE_MAX_TOKENS - PROMPT_OVERHEAD_TOKENS
+                encoding = self.load_token_encoding(ai_summarizer.token_model)
+                chunks = self.chunk_sections(sections, prompt_budget, encoding)
+                if chunks is None:
+                    summary = ai_summarizer.summarize(self._join_sections(sections), bullet_count)
+                else:
+                    summary = self.generate_summary_map_reduce(
+                        chunks, bullet_count, ai_summarizer.summarize, ai_summarizer.cache_namespace,
+                        prompt_budget, encoding, use_cache)
                 
         except Exception as e:
             print(f"Warning: AI summarization failed ({e}). Using basic summarization.")
-            summary = self.generate_summary_basic(combined_content, bullet_count)
+            summary = self.generate_summary_basic(self._join_sections(sections), bullet_count)
         
-        # Create header with metadata
+        return self._build_header(timeframe, processed_files, bullet_count, duplicate_count) + summary
+    
+    def _join_sections(self, sections: List[Tuple[str, str]]) -> str:
+        """Combine (header, content) sections into one prompt text."""
+        pieces = []
+        for section_header, content in sections:
+            if pieces:
+                pieces.append('\n\n')
+            pieces.extend((section_header, '\n', content))
+        return ''.join(pieces)
+    
+    def _build_header(self, timeframe: Optional[str], processed_files: List[str],
+                      bullet_count: int, duplicate_count: int = 0) -> str:
+        """Create the metadata header placed above the summary."""
         header = f"# Log Summary\n\n"
         header += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
         header += f"**Timeframe:** {timeframe or 'Last 7 days'}\n"
         header += f"**Files processed:** {len(processed_files)}\n"
+        if duplicate_count:
+            header += f"**Duplicate files skipped:** {duplicate_count}\n"
         header += f"**Files:** {', '.join(processed_files)}\n\n"
         header += f"## Summary ({bullet_count} key points)\n\n"
         
-        return header + summary
+        return header
 
 
 def setup_argument_parser() -> argparse.ArgumentParser:
@@ -598,6 +1337,7 @@ Examples:
   %(prog)s --custom-api-url http://localhost  # Use custom API endpoint
   %(prog)s --no-ai                            # Use basic summarization (no API calls)
   %(prog)s --think                            # Preserve thinking output in AI responses
+  %(prog)s --no-cache                         # Do not store partial summaries on disk
 
 Content Types:
   --text      # Process .txt and .md files (default)
@@ -698,6 +1438,12 @@ AI Providers:
         help='Preserve thinking output in AI responses (default: suppress thinking)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write cached partial summaries in ~/.cache/log_summary/'
+    )
+    
     return parser
 
 
@@ -773,7 +1519,8 @@ def main():
             ollama_model=args.ollama_model,
             custom_api_url=args.custom_api_url,
             custom_api_key=custom_api_key,
-            preserve_thinking=args.think
+            preserve_thinking=args.think,
+            use_cache=not args.no_cache
         )
         
         # Output results